@@ -8,15 +8,26 @@ from __future__ import annotations
 
 import atexit
 import datetime
+import threading
 import time
 from collections import deque
+from functools import lru_cache
 
 import cv2
 import numpy as np
-import plotly.graph_objects as go
+import orjson  # noqa: F401 — plotly auto-selects orjson for figure JSON when installed
 import streamlit as st
 
-from src.pipeline import initialize_webcam, release_webcam, run_pipeline
+from dataclasses import replace
+
+from src.pipeline import (
+    PipelineResult,
+    ThreadedCapture,
+    initialize_webcam,
+    process_frame,
+    release_webcam,
+    warmup,
+)
 from src.regulation.workflow_regulator import apply_regulation, get_last_recommendation
 
 # ──────────────────────────────────────────────────────────────
@@ -24,6 +35,7 @@ from src.regulation.workflow_regulator import apply_regulation, get_last_recomme
 # ──────────────────────────────────────────────────────────────
 
 MAX_HISTORY = 600  # keep ~10 min of data
+TARGET_PERIOD = 1.0 / 12.0  # render-loop frame budget in seconds (~12 fps)
 
 
 def _status_label(load: float) -> tuple[str, str]:
@@ -57,6 +69,120 @@ def _blink_color(rate: float) -> str:
     return "#e74c3c"
 
 
+def _push(ph, key: str, content: str) -> None:
+    """Update a placeholder only when its content actually changed.
+
+    Every ph.markdown call sends a websocket delta even for identical
+    content; hashing per placeholder skips those no-op pushes.
+    """
+    hashes = st.session_state["_md_hash"]
+    digest = hash(content)
+    if hashes.get(key) == digest:
+        return
+    hashes[key] = digest
+    ph.markdown(content, unsafe_allow_html=True)
+
+
+def _sleep_remaining(tick_start: float) -> None:
+    """Sleep off whatever is left of this tick's frame budget.
+
+    Unlike a fixed sleep, this keeps the render cadence stable: fast ticks
+    wait longer, slow ticks do not add latency on top of their own cost.
+    """
+    elapsed = time.perf_counter() - tick_start
+    time.sleep(max(0.0, TARGET_PERIOD - elapsed))
+
+
+class _RingBuffer:
+    """Preallocated float32 ring buffer for metric history.
+
+    Replaces the deque histories so per-tick stats run as single NumPy C
+    calls instead of materializing a 600-element Python list first.
+    """
+
+    def __init__(self, size: int):
+        self._buf = np.zeros(size, dtype=np.float32)
+        self._size = size
+        self._count = 0
+
+    def __len__(self) -> int:
+        return min(self._count, self._size)
+
+    def append(self, value: float) -> None:
+        self._buf[self._count % self._size] = value
+        self._count += 1
+
+    def view(self) -> np.ndarray:
+        """Return stored values in insertion order (copies only once wrapped)."""
+        if self._count <= self._size:
+            return self._buf[: self._count]
+        cursor = self._count % self._size
+        return np.concatenate((self._buf[cursor:], self._buf[:cursor]))
+
+    def mean(self) -> float:
+        n = len(self)
+        return float(self._buf[:n].mean()) if n else 0.0
+
+    def sum(self) -> float:
+        return float(self._buf[: len(self)].sum())
+
+
+# ──────────────────────────────────────────────────────────────
+# Background inference thread
+# ──────────────────────────────────────────────────────────────
+
+class _WorkerThread(threading.Thread):
+    """Runs face metrics + load scoring off the render thread.
+
+    Frames come straight from the pipeline's ThreadedCapture, which
+    already does latest-wins buffering in its own thread; an identity
+    check avoids reprocessing a frame the capture hasn't replaced yet.
+    """
+
+    def __init__(self, capture: ThreadedCapture):
+        super().__init__(daemon=True, name="aura-worker")
+        self._capture = capture
+        self._lock = threading.Lock()
+        self._latest: PipelineResult | None = None
+        self._error: Exception | None = None
+        self._last_frame = None
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            frame = self._capture.latest()
+            if frame is None or frame is self._last_frame:
+                time.sleep(0.005)
+                continue
+            self._last_frame = frame
+            try:
+                # Snapshot the pipeline's reused result slot: it is mutated
+                # in place on the next step, while the render thread may
+                # still be reading this one.
+                result = replace(process_frame(frame))
+            except Exception as exc:
+                # Keep the failure for the render loop to surface; a
+                # persistent one would otherwise leave the dashboard
+                # blank with no error shown.
+                with self._lock:
+                    self._error = exc
+                continue
+            with self._lock:
+                self._latest = result
+                self._error = None
+
+    def latest(self) -> PipelineResult | None:
+        with self._lock:
+            return self._latest
+
+    def last_error(self) -> Exception | None:
+        with self._lock:
+            return self._error
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
 # ──────────────────────────────────────────────────────────────
 # Session state bootstrap
 # ──────────────────────────────────────────────────────────────
@@ -64,11 +190,12 @@ def _blink_color(rate: float) -> str:
 def _init_session():
     defaults = {
         "capture": None,
+        "worker_thread": None,
         "history_ts": deque(maxlen=MAX_HISTORY),
-        "history_blink": deque(maxlen=MAX_HISTORY),
-        "history_breathing": deque(maxlen=MAX_HISTORY),
-        "history_load": deque(maxlen=MAX_HISTORY),
-        "history_head": deque(maxlen=MAX_HISTORY),
+        "history_blink": _RingBuffer(MAX_HISTORY),
+        "history_breathing": _RingBuffer(MAX_HISTORY),
+        "history_load": _RingBuffer(MAX_HISTORY),
+        "history_head": _RingBuffer(MAX_HISTORY),
         "peak_load": 0.0,
         "peak_blink": 0.0,
         "session_start": time.time(),
@@ -88,15 +215,38 @@ def _init_session():
             st.session_state[key] = val
 
 
-def _ensure_capture() -> cv2.VideoCapture:
+def _ensure_capture() -> ThreadedCapture:
     cap = st.session_state.get("capture")
     if cap is None or not cap.isOpened():
         cap = initialize_webcam()
+        # Compile/load the heavy bits now so the first rendered frame
+        # doesn't absorb the startup stall.
+        warmup(cap)
         st.session_state.capture = cap
     return cap
 
 
+def _ensure_workers(capture: ThreadedCapture) -> _WorkerThread:
+    """Start (or restart) the inference thread for this session."""
+    worker = st.session_state.get("worker_thread")
+    if worker is not None and worker.is_alive():
+        return worker
+
+    worker = _WorkerThread(capture)
+    st.session_state.worker_thread = worker
+    worker.start()
+    return worker
+
+
+def _stop_workers() -> None:
+    worker = st.session_state.get("worker_thread")
+    if worker is not None:
+        worker.stop()
+        st.session_state.worker_thread = None
+
+
 def _cleanup_capture() -> None:
+    _stop_workers()
     cap = st.session_state.get("capture")
     if cap is not None:
         release_webcam(cap)
@@ -109,45 +259,69 @@ atexit.register(_cleanup_capture)
 # Plotly chart builders
 # ──────────────────────────────────────────────────────────────
 
-_CHART_LAYOUT = dict(
-    paper_bgcolor="rgba(0,0,0,0)",
-    plot_bgcolor="rgba(17,17,17,0.6)",
-    font_color="#c8c8c8",
-    margin=dict(l=40, r=20, t=35, b=30),
-    height=240,
-    xaxis=dict(showgrid=False),
-    yaxis=dict(gridcolor="rgba(255,255,255,0.07)"),
-)
+# Figures are built as plain dict specs (not go.Figure) so each ~1 s refresh
+# skips Plotly's recursive per-attribute schema validation. Constant layouts
+# are assembled once here instead of being re-merged on every call.
+
+_CHART_LAYOUT = {
+    "paper_bgcolor": "rgba(0,0,0,0)",
+    "plot_bgcolor": "rgba(17,17,17,0.6)",
+    "font": {"color": "#c8c8c8"},
+    "margin": {"l": 40, "r": 20, "t": 35, "b": 30},
+    "height": 240,
+    "xaxis": {"showgrid": False},
+    "yaxis": {"gridcolor": "rgba(255,255,255,0.07)"},
+}
 
+_GAUGE_LAYOUT = {
+    "paper_bgcolor": "rgba(0,0,0,0)",
+    "plot_bgcolor": "rgba(0,0,0,0)",
+    "font": {"color": "#c8c8c8"},
+    "margin": {"l": 30, "r": 30, "t": 60, "b": 20},
+    "height": 220,
+}
+
+_PIE_LAYOUT = {
+    "paper_bgcolor": "rgba(0,0,0,0)",
+    "font": {"color": "#c8c8c8"},
+    "margin": {"l": 10, "r": 10, "t": 30, "b": 10},
+    "height": 260,
+    "showlegend": False,
+    "title": {"text": "Time in Zones", "font": {"size": 14}},
+}
 
-def _gauge_chart(value: float, title: str, max_val: float, color: str) -> go.Figure:
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=value,
-        title={"text": title, "font": {"size": 16, "color": "#ddd"}},
-        number={"font": {"size": 32, "color": color}},
-        gauge={
-            "axis": {"range": [0, max_val], "tickcolor": "#555"},
-            "bar": {"color": color},
-            "bgcolor": "rgba(30,30,30,0.8)",
-            "bordercolor": "#333",
-            "steps": [
-                {"range": [0, max_val * 0.35], "color": "rgba(46,204,113,0.15)"},
-                {"range": [max_val * 0.35, max_val * 0.7], "color": "rgba(243,156,18,0.15)"},
-                {"range": [max_val * 0.7, max_val], "color": "rgba(231,76,60,0.15)"},
-            ],
-        },
-    ))
-    fig.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font_color="#c8c8c8",
-        margin=dict(l=30, r=30, t=60, b=20),
-        height=220,
+
+@lru_cache(maxsize=8)
+def _gauge_steps(max_val: float) -> tuple:
+    """Zone bands for the gauge; constant per max_val, so built once."""
+    return (
+        {"range": [0, max_val * 0.35], "color": "rgba(46,204,113,0.15)"},
+        {"range": [max_val * 0.35, max_val * 0.7], "color": "rgba(243,156,18,0.15)"},
+        {"range": [max_val * 0.7, max_val], "color": "rgba(231,76,60,0.15)"},
     )
-    return fig
 
 
+def _gauge_chart(value: float, title: str, max_val: float, color: str) -> dict:
+    return {
+        "data": [{
+            "type": "indicator",
+            "mode": "gauge+number",
+            "value": value,
+            "title": {"text": title, "font": {"size": 16, "color": "#ddd"}},
+            "number": {"font": {"size": 32, "color": color}},
+            "gauge": {
+                "axis": {"range": [0, max_val], "tickcolor": "#555"},
+                "bar": {"color": color},
+                "bgcolor": "rgba(30,30,30,0.8)",
+                "bordercolor": "#333",
+                "steps": _gauge_steps(max_val),
+            },
+        }],
+        "layout": _GAUGE_LAYOUT,
+    }
+
+
+@lru_cache(maxsize=32)
 def _hex_to_rgba(hex_color: str, alpha: float = 0.10) -> str:
     """Convert '#rrggbb' to 'rgba(r,g,b,alpha)' for Plotly compatibility."""
     h = hex_color.lstrip("#")
@@ -155,48 +329,52 @@ def _hex_to_rgba(hex_color: str, alpha: float = 0.10) -> str:
     return f"rgba({r},{g},{b},{alpha})"
 
 
-def _sparkline(ts, values, color, title, yrange=None) -> go.Figure:
-    fig = go.Figure()
+@lru_cache(maxsize=8)
+def _sparkline_layout(title: str, yrange: tuple | None) -> dict:
+    """Per-chart layout; titles/ranges are fixed, so merge _CHART_LAYOUT once."""
+    layout = {**_CHART_LAYOUT, "title": {"text": title, "font": {"size": 14}}}
+    if yrange:
+        layout["yaxis"] = {**_CHART_LAYOUT["yaxis"], "range": list(yrange)}
+    return layout
+
+
+def _sparkline(ts, values, color, title, yrange=None) -> dict:
     # Build fill color with alpha
     if "rgb" in color:
         fill_c = color.replace(")", ",0.10)").replace("rgb", "rgba")
     else:
         fill_c = _hex_to_rgba(color, 0.10)
-    fig.add_trace(go.Scatter(
-        x=list(ts), y=list(values),
-        mode="lines",
-        line=dict(color=color, width=2),
-        fill="tozeroy",
-        fillcolor=fill_c,
-        hovertemplate="%{y:.1f}<extra></extra>",
-    ))
-    layout = {**_CHART_LAYOUT, "title": {"text": title, "font": {"size": 14}}}
-    if yrange:
-        layout["yaxis"] = {**layout.get("yaxis", {}), "range": yrange}
-    fig.update_layout(**layout)
-    return fig
-
-
-def _zone_pie(deep: float, normal: float, fried: float) -> go.Figure:
-    labels = ["Deep Flow", "Normal", "Brain Fried"]
-    vals = [max(deep, 0.01), max(normal, 0.01), max(fried, 0.01)]
-    colors = ["#2ecc71", "#f39c12", "#e74c3c"]
-    fig = go.Figure(go.Pie(
-        labels=labels, values=vals,
-        marker=dict(colors=colors),
-        hole=0.55,
-        textinfo="percent+label",
-        textfont_size=12,
-    ))
-    fig.update_layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        font_color="#c8c8c8",
-        margin=dict(l=10, r=10, t=30, b=10),
-        height=260,
-        showlegend=False,
-        title={"text": "Time in Zones", "font": {"size": 14}},
-    )
-    return fig
+    layout = _sparkline_layout(title, tuple(yrange) if yrange else None)
+    return {
+        "data": [{
+            # Scattergl renders via WebGL — one GPU draw call, not N SVG nodes.
+            "type": "scattergl",
+            "x": list(ts),
+            # Contiguous float32 arrays hit orjson's native NumPy fast path.
+            "y": np.asarray(values, dtype=np.float32),
+            "mode": "lines",
+            "line": {"color": color, "width": 2},
+            "fill": "tozeroy",
+            "fillcolor": fill_c,
+            "hovertemplate": "%{y:.1f}<extra></extra>",
+        }],
+        "layout": layout,
+    }
+
+
+def _zone_pie(deep: float, normal: float, fried: float) -> dict:
+    return {
+        "data": [{
+            "type": "pie",
+            "labels": ["Deep Flow", "Normal", "Brain Fried"],
+            "values": [max(deep, 0.01), max(normal, 0.01), max(fried, 0.01)],
+            "marker": {"colors": ["#2ecc71", "#f39c12", "#e74c3c"]},
+            "hole": 0.55,
+            "textinfo": "percent+label",
+            "textfont": {"size": 12},
+        }],
+        "layout": _PIE_LAYOUT,
+    }
 
 
 # ──────────────────────────────────────────────────────────────
@@ -280,6 +458,51 @@ _CSS = """
 """
 
 
+# Alert banner templates, keyed by alert id and rendered in a fixed order.
+# Building the banner as one join over these avoids repeated string
+# reallocation and keeps the output deterministic for dedup/caching.
+_ALERT_TEMPLATES = {
+    "load_critical": (
+        '<div class="alert-banner alert-critical">'
+        'CRITICAL: Cognitive load is {load:.1f} (threshold: 70). '
+        'Take a break or simplify your current task.</div>'
+    ),
+    "load_warning": (
+        '<div class="alert-banner alert-warning">'
+        'WARNING: Cognitive load is {load:.1f} (threshold: 35). '
+        'Monitor your pace.</div>'
+    ),
+    "blink_high": (
+        '<div class="alert-banner alert-critical">'
+        'ALERT: Blink rate is {blink:.0f}/min (limit: 30). '
+        'Eye strain detected -- look away from the screen.</div>'
+    ),
+    "breathing_abnormal": (
+        '<div class="alert-banner alert-warning">'
+        'WARNING: Breathing rate is {breathing:.1f} bpm '
+        '(normal: 12-20). Try slow, controlled breathing.</div>'
+    ),
+    "posture_forward": (
+        '<div class="alert-banner alert-warning">'
+        'WARNING: Forward head posture detected. '
+        'Sit back and align your screen to eye level.</div>'
+    ),
+}
+
+_ALERT_ORDER = (
+    "load_critical",
+    "load_warning",
+    "blink_high",
+    "breathing_abnormal",
+    "posture_forward",
+)
+
+_ALL_CLEAR_HTML = (
+    '<div class="alert-banner alert-ok">'
+    'All clear -- all metrics within healthy limits.</div>'
+)
+
+
 def _kpi_html(label: str, value: str, color: str, sub: str = "") -> str:
     return (
         f'<div class="kpi-card">'
@@ -363,6 +586,11 @@ with st.sidebar:
     st.markdown("---")
     st.caption("Powered by MediaPipe · OpenAI · Streamlit")
 
+# The placeholders below are recreated empty on every rerun, so the
+# content hashes that suppress no-op pushes must be reset with them —
+# otherwise unchanged content would never be re-rendered after a rerun.
+st.session_state["_md_hash"] = {}
+
 # ── Header ───────────────────────────────────────────────────
 header_left, header_right = st.columns([5, 2])
 with header_left:
@@ -376,12 +604,8 @@ st.markdown("---")
 # ── Alert Banner ─────────────────────────────────────────────
 alert_banner_ph = st.empty()
 
-# ── Row 1 — KPI Cards ───────────────────────────────────────
-kpi1, kpi2, kpi3, kpi4 = st.columns(4)
-kpi1_ph = kpi1.empty()
-kpi2_ph = kpi2.empty()
-kpi3_ph = kpi3.empty()
-kpi4_ph = kpi4.empty()
+# ── Row 1 — KPI Cards (single placeholder: one delta message per tick) ──
+kpi_row_ph = st.empty()
 
 # ── Row 2 — Webcam + Gauge ──────────────────────────────────
 st.markdown("####")
@@ -428,14 +652,27 @@ with st.expander("Event & Alert Log", expanded=False):
 
 try:
     capture = _ensure_capture()
+    worker = _ensure_workers(capture)
 
     while st.session_state.running:
-        result = run_pipeline(capture)
+        tick_start = time.perf_counter()
+
+        error = worker.last_error()
+        if error is not None:
+            # Re-raise on the render thread so the st.error handler below
+            # shows the failure instead of spinning on a blank dashboard.
+            raise RuntimeError("Metric pipeline failed in the background worker.") from error
+
+        result = worker.latest()
+        if result is None:
+            # Threads are still warming up; nothing to render yet.
+            time.sleep(0.05)
+            continue
 
-        blink_rate = float(result.get("blink_rate", 0.0))
-        breathing_rate = float(result.get("breathing_rate", 0.0))
-        head_forward = bool(result.get("head_forward", False))
-        load_score = float(result.get("load_score", 0.0))
+        blink_rate = float(result.blink_rate)
+        breathing_rate = float(result.breathing_rate)
+        head_forward = bool(result.head_forward)
+        load_score = float(result.load_score)
 
         st.session_state.frame_count += 1
         # Only update heavy charts every ~12 frames (~1 s)
@@ -481,61 +718,31 @@ try:
             st.session_state.time_deep_flow += dt
 
         # ── Notifications & Alerts ──
-        alerts_html = ""
         active_alerts: set[str] = set()
         now_ts = time.time()
 
-        # High cognitive load
         if load_score >= 70:
-            alerts_html += (
-                '<div class="alert-banner alert-critical">'
-                f'CRITICAL: Cognitive load is {load_score:.1f} (threshold: 70). '
-                'Take a break or simplify your current task.</div>'
-            )
             active_alerts.add("load_critical")
         elif load_score >= 35:
-            alerts_html += (
-                '<div class="alert-banner alert-warning">'
-                f'WARNING: Cognitive load is {load_score:.1f} (threshold: 35). '
-                'Monitor your pace.</div>'
-            )
             active_alerts.add("load_warning")
-
-        # High blink rate
         if blink_rate > 30:
-            alerts_html += (
-                '<div class="alert-banner alert-critical">'
-                f'ALERT: Blink rate is {blink_rate:.0f}/min (limit: 30). '
-                'Eye strain detected -- look away from the screen.</div>'
-            )
             active_alerts.add("blink_high")
-
-        # Breathing out of range
         if breathing_rate < 12 or breathing_rate > 20:
-            alerts_html += (
-                '<div class="alert-banner alert-warning">'
-                f'WARNING: Breathing rate is {breathing_rate:.1f} bpm '
-                f'(normal: 12-20). Try slow, controlled breathing.</div>'
-            )
             active_alerts.add("breathing_abnormal")
-
-        # Poor posture
         if head_forward:
-            alerts_html += (
-                '<div class="alert-banner alert-warning">'
-                'WARNING: Forward head posture detected. '
-                'Sit back and align your screen to eye level.</div>'
-            )
             active_alerts.add("posture_forward")
 
-        if alerts_html:
-            alert_banner_ph.markdown(alerts_html, unsafe_allow_html=True)
-        else:
-            alert_banner_ph.markdown(
-                '<div class="alert-banner alert-ok">'
-                'All clear -- all metrics within healthy limits.</div>',
-                unsafe_allow_html=True,
+        if active_alerts:
+            alerts_html = "".join(
+                _ALERT_TEMPLATES[key].format(
+                    load=load_score, blink=blink_rate, breathing=breathing_rate
+                )
+                for key in _ALERT_ORDER
+                if key in active_alerts
             )
+            _push(alert_banner_ph, "alerts", alerts_html)
+        else:
+            _push(alert_banner_ph, "alerts", _ALL_CLEAR_HTML)
 
         # Toast notifications (cooldown: 5 s between toasts)
         new_alerts = active_alerts - st.session_state.prev_alerts
@@ -557,38 +764,36 @@ try:
         st.session_state.prev_alerts = active_alerts
 
         # ── Render status badge ──
-        status_ph.markdown(
+        _push(
+            status_ph,
+            "status",
             f'<div style="text-align:right;margin-top:18px;">'
             f'<span class="status-badge" style="background:{color};color:#fff;">'
             f'{label}</span></div>',
-            unsafe_allow_html=True,
         )
 
-        # ── KPI cards ──
-        kpi1_ph.markdown(
-            _kpi_html("Load Score", f"{load_score:.1f}", _load_color(load_score), "out of 100"),
-            unsafe_allow_html=True,
-        )
-        kpi2_ph.markdown(
-            _kpi_html("Blink Rate", f"{blink_rate:.1f}", _blink_color(blink_rate), "blinks / min"),
-            unsafe_allow_html=True,
-        )
-        kpi3_ph.markdown(
-            _kpi_html("Breathing", f"{breathing_rate:.1f}", _breathing_color(breathing_rate), "breaths / min"),
-            unsafe_allow_html=True,
-        )
+        # ── KPI cards (one markdown flush for the whole row) ──
         posture_txt = "Forward" if head_forward else "Good"
         posture_clr = "#e74c3c" if head_forward else "#2ecc71"
-        kpi4_ph.markdown(
-            _kpi_html("Posture", posture_txt, posture_clr, "head position"),
-            unsafe_allow_html=True,
+        _push(
+            kpi_row_ph,
+            "kpi",
+            '<div style="display:grid;grid-template-columns:repeat(4,1fr);gap:12px">'
+            + _kpi_html("Load Score", f"{load_score:.1f}", _load_color(load_score), "out of 100")
+            + _kpi_html("Blink Rate", f"{blink_rate:.1f}", _blink_color(blink_rate), "blinks / min")
+            + _kpi_html("Breathing", f"{breathing_rate:.1f}", _breathing_color(breathing_rate), "breaths / min")
+            + _kpi_html("Posture", posture_txt, posture_clr, "head position")
+            + "</div>",
         )
 
         # ── Webcam frame ──
-        frame = result.get("frame")
+        frame = result.frame
         if frame is not None:
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frame_ph.image(frame_rgb, channels="RGB", use_container_width=True)
+            # Pre-encode to JPEG: ~10x smaller websocket payload than a raw
+            # RGB ndarray, and the browser decodes it in hardware.
+            ok, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
+            if ok:
+                frame_ph.image(jpeg.tobytes(), use_container_width=True)
 
         # ── Gauge (throttled) ──
         _fc = st.session_state.frame_count
@@ -601,26 +806,26 @@ try:
 
         # ── Tips below gauge ──
         tips = _generate_tips(load_score, head_forward, blink_rate, breathing_rate)
-        tips_header_ph.markdown("##### Current Advice")
+        _push(tips_header_ph, "tips_header", "##### Current Advice")
         tips_html = "".join(f'<div class="rec-card">{t}</div>' for t in tips)
-        tips_ph.markdown(tips_html, unsafe_allow_html=True)
+        _push(tips_ph, "tips", tips_html)
 
         # ── Time-series charts (throttled) ──
         if _update_charts:
             ts_list = list(st.session_state.history_ts)
             if len(ts_list) > 2:
                 chart_load_ph.plotly_chart(
-                    _sparkline(ts_list, list(st.session_state.history_load), "#e74c3c", "Load Score", [0, 100]),
+                    _sparkline(ts_list, st.session_state.history_load.view(), "#e74c3c", "Load Score", [0, 100]),
                     use_container_width=True,
                     key=f"cl_{_fc}",
                 )
                 chart_blink_ph.plotly_chart(
-                    _sparkline(ts_list, list(st.session_state.history_blink), "#3498db", "Blink Rate (bpm)"),
+                    _sparkline(ts_list, st.session_state.history_blink.view(), "#3498db", "Blink Rate (bpm)"),
                     use_container_width=True,
                     key=f"cb_{_fc}",
                 )
                 chart_breath_ph.plotly_chart(
-                    _sparkline(ts_list, list(st.session_state.history_breathing), "#2ecc71", "Breathing Rate (bpm)", [5, 30]),
+                    _sparkline(ts_list, st.session_state.history_breathing.view(), "#2ecc71", "Breathing Rate (bpm)", [5, 30]),
                     use_container_width=True,
                     key=f"cr_{_fc}",
                 )
@@ -639,25 +844,14 @@ try:
 
         # Session stats table (throttled)
         if not _update_charts:
-            time.sleep(0.08)
+            _sleep_remaining(tick_start)
             continue
 
-        avg_load = (
-            float(np.mean(list(st.session_state.history_load)))
-            if st.session_state.history_load else 0
-        )
-        avg_blink = (
-            float(np.mean(list(st.session_state.history_blink)))
-            if st.session_state.history_blink else 0
-        )
-        avg_breath = (
-            float(np.mean(list(st.session_state.history_breathing)))
-            if st.session_state.history_breathing else 0
-        )
-        head_fwd_pct = (
-            (sum(st.session_state.history_head) / len(st.session_state.history_head) * 100)
-            if st.session_state.history_head else 0
-        )
+        avg_load = st.session_state.history_load.mean()
+        avg_blink = st.session_state.history_blink.mean()
+        avg_breath = st.session_state.history_breathing.mean()
+        head_hist = st.session_state.history_head
+        head_fwd_pct = (head_hist.sum() / len(head_hist) * 100) if len(head_hist) else 0
 
         stats_md = (
             "| Metric | Value |\n"
@@ -670,7 +864,7 @@ try:
             f"| Head Forward | **{head_fwd_pct:.0f}%** of session |\n"
             f"| Alerts | **{st.session_state.alert_count}** |\n"
         )
-        session_stats_ph.markdown(stats_md)
+        _push(session_stats_ph, "stats", stats_md)
 
         # ── Recommendations log ──
         if st.session_state.recommendations:
@@ -678,19 +872,21 @@ try:
             for r in reversed(st.session_state.recommendations):
                 recs_html += f'<div class="rec-card">{r}</div>'
             recs_html += "</div>"
-            rec_list_ph.markdown(recs_html, unsafe_allow_html=True)
+            _push(rec_list_ph, "recs", recs_html)
         else:
             rec_list_ph.info("No AI-generated recommendations yet. They appear when load exceeds 70%.")
 
         # ── Event log ──
         if st.session_state.recommendations:
-            log_ph.markdown(
-                "\n\n".join(f"- {r}" for r in reversed(st.session_state.recommendations))
+            _push(
+                log_ph,
+                "log",
+                "\n\n".join(f"- {r}" for r in reversed(st.session_state.recommendations)),
             )
         else:
             log_ph.caption("No events recorded yet.")
 
-        time.sleep(0.08)
+        _sleep_remaining(tick_start)
 
 except Exception as exc:
     st.error(f"Runtime error: {exc}")
@@ -0,0 +1,25 @@
+"""Optional build script for the compiled scoring kernel.
+
+Run ``python setup.py build_ext --inplace`` to compile
+``src/detection/_load_detector.pyx``. This is entirely optional: when the
+extension (or Cython itself) is missing, the detector falls back to the
+Numba or pure-Python kernel with identical behavior.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        ["src/detection/_load_detector.pyx"], language_level=3
+    )
+
+setup(
+    name="aura-cognitive-monitor",
+    ext_modules=ext_modules,
+)
@@ -6,19 +6,32 @@ This module provides a minimal, synchronous API:
 
 from __future__ import annotations
 
-import math
+import logging
+import os
+import queue
+import threading
 import time
-from typing import Dict, List, Tuple
+from collections import deque
+from typing import Dict
 
 import cv2
 import mediapipe as mp
+import numpy as np
+
+try:
+	from numba import njit
+except ImportError:
+	njit = None
 
 mp_face_mesh = mp.solutions.face_mesh
 
+_logger = logging.getLogger(__name__)
+
 
 # Eye landmark indices from MediaPipe Face Mesh (6 points per eye for EAR).
 LEFT_EYE_IDX = [33, 160, 158, 133, 153, 144]
 RIGHT_EYE_IDX = [362, 385, 387, 263, 373, 380]
+EYE_IDX = LEFT_EYE_IDX + RIGHT_EYE_IDX
 
 # Nose tip landmark used for forward-lean estimation.
 NOSE_TIP_IDX = 1
@@ -30,17 +43,32 @@ BLINK_DEBOUNCE_SECONDS = 0.15
 BLINK_WINDOW_SECONDS = 60.0
 NOSE_FORWARD_Z_THRESHOLD = -0.08
 
+# FaceMesh runs a small internal detector, so feeding it full-resolution
+# frames only wastes resize/memory bandwidth. Frames wider than this are
+# downscaled before inference; landmarks are normalized (0-1) so pixel-space
+# math keeps using the original frame dimensions.
+FACE_MESH_INPUT_WIDTH = int(os.getenv("AURA_FACE_MESH_WIDTH", "480"))
 
-# Persistent state to estimate blink-rate across frames.
+
+# Persistent state to estimate blink-rate across frames. Timestamps live in a
+# deque so expired entries are popped from the left in O(k) instead of
+# rebuilding the whole list every frame.
 _state = {
-	"start_time": time.time(),
+	"start_time": time.monotonic(),
 	"blink_count": 0,
 	"eyes_closed": False,
 	"last_blink_ts": 0.0,
-	"blink_timestamps": [],
+	"blink_timestamps": deque(),
+	"last_blink_rate": 0.0,
 }
 
 
+# Reused destination buffer for the pre-inference downscale, sized lazily to
+# the first frame. Reusing it stops cv2.resize from allocating a fresh
+# ~0.5 MB array every frame.
+_small_buf: np.ndarray | None = None
+
+
 # Reuse a single FaceMesh instance for efficiency.
 _face_mesh = mp_face_mesh.FaceMesh(
 	static_image_mode=False,
@@ -51,92 +79,138 @@ _face_mesh = mp_face_mesh.FaceMesh(
 )
 
 
-def _distance(a: Tuple[float, float], b: Tuple[float, float]) -> float:
-	"""Euclidean distance between two 2D points."""
-	return math.dist(a, b)
-
+def _ear_and_blink_kernel(pts, prev_closed, last_blink_ts, now_ts,
+		ear_closed, ear_open, debounce):
+	"""EAR plus the hysteresis/debounce blink step, in one scalar kernel.
 
-def _eye_aspect_ratio(eye_points: List[Tuple[float, float]]) -> float:
-	"""Compute EAR from 6 eye points.
+	``pts`` is a (12, 2) float32 array: left-eye points in rows 0-5,
+	right-eye points in rows 6-11, each eye ordered [p1..p6] with
+	EAR = (|p2-p6| + |p3-p5|) / (2 * |p1-p4|).
 
-	Points expected order:
-	[p1, p2, p3, p4, p5, p6]
-	EAR = (|p2-p6| + |p3-p5|) / (2 * |p1-p4|)
+	Returns (avg_ear, new_closed, new_last_blink_ts, blink_triggered).
 	"""
-	p1, p2, p3, p4, p5, p6 = eye_points
-	horizontal = _distance(p1, p4)
-	if horizontal == 0:
-		return 0.0
-	vertical = _distance(p2, p6) + _distance(p3, p5)
-	return vertical / (2.0 * horizontal)
+	ear_sum = 0.0
+	for off in (0, 6):
+		dx = pts[off, 0] - pts[off + 3, 0]
+		dy = pts[off, 1] - pts[off + 3, 1]
+		horizontal = (dx * dx + dy * dy) ** 0.5
+		if horizontal == 0.0:
+			ear = 0.0
+		else:
+			v1x = pts[off + 1, 0] - pts[off + 5, 0]
+			v1y = pts[off + 1, 1] - pts[off + 5, 1]
+			v2x = pts[off + 2, 0] - pts[off + 4, 0]
+			v2y = pts[off + 2, 1] - pts[off + 4, 1]
+			vertical = (v1x * v1x + v1y * v1y) ** 0.5 + (v2x * v2x + v2y * v2y) ** 0.5
+			ear = vertical / (2.0 * horizontal)
+		ear_sum += ear
+	avg_ear = ear_sum / 2.0
 
+	# Hysteresis avoids jitter around a single threshold.
+	blink_triggered = False
+	new_closed = prev_closed
+	new_last_ts = last_blink_ts
+	if prev_closed:
+		if avg_ear > ear_open:
+			if (now_ts - last_blink_ts) >= debounce:
+				blink_triggered = True
+				new_last_ts = now_ts
+			new_closed = False
+	else:
+		if avg_ear < ear_closed:
+			new_closed = True
 
-def _landmark_xy(landmark, width: int, height: int) -> Tuple[float, float]:
-	"""Convert normalized landmark to pixel-space XY."""
-	return landmark.x * width, landmark.y * height
+	return avg_ear, new_closed, new_last_ts, blink_triggered
 
 
-def extract_face_metrics(frame) -> Dict[str, float | bool]:
-	"""Extract minimal face metrics from a frame.
+# JIT-compile the per-frame kernel when Numba is available; the pure-Python
+# version is a drop-in fallback with identical semantics.
+if njit is not None:
+	_ear_and_blink = njit(cache=True, fastmath=True)(_ear_and_blink_kernel)
+else:
+	_ear_and_blink = _ear_and_blink_kernel
 
-	Args:
-		frame: OpenCV BGR frame.
 
-	Returns:
-		{
-		  "blink_rate": float,   # blinks per minute
-		  "head_forward": bool   # True when nose is sufficiently forward
-		}
+def _landmarks_xy(landmarks, width: int, height: int) -> np.ndarray:
+	"""Gather all normalized landmarks into a (N, 2) pixel-space array."""
+	lm_xy = np.fromiter(
+		(v for lm in landmarks for v in (lm.x, lm.y)),
+		dtype=np.float32,
+		count=len(landmarks) * 2,
+	).reshape(-1, 2)
+	lm_xy *= (width, height)
+	return lm_xy
+
+
+def _current_blink_rate(now_ts: float) -> float:
+	"""Prune expired blinks and return the blinks-per-minute rate.
+
+	Shared by the face-found and no-face paths. The rate is cached and only
+	refreshed when the window contents actually change, so consecutive
+	face-miss frames cost a couple of comparisons and no allocations.
 	"""
-	if frame is None:
-		return {"blink_rate": 0.0, "head_forward": False}
+	timestamps = _state["blink_timestamps"]
+	window_start = now_ts - BLINK_WINDOW_SECONDS
+	while timestamps and timestamps[0] < window_start:
+		timestamps.popleft()
+	if len(timestamps) != _state["last_blink_rate"]:
+		_state["last_blink_rate"] = float(len(timestamps))
+	return _state["last_blink_rate"]
+
+
+def _infer(frame) -> Dict[str, float | bool]:
+	"""Run FaceMesh plus metric extraction synchronously on one frame."""
+	global _small_buf
 
 	height, width = frame.shape[:2]
-	rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+	if width > FACE_MESH_INPUT_WIDTH:
+		small_height = int(height * FACE_MESH_INPUT_WIDTH / width)
+		if _small_buf is None or _small_buf.shape[:2] != (small_height, FACE_MESH_INPUT_WIDTH):
+			_small_buf = np.empty(
+				(small_height, FACE_MESH_INPUT_WIDTH, 3), dtype=frame.dtype
+			)
+		small = cv2.resize(
+			frame,
+			(FACE_MESH_INPUT_WIDTH, small_height),
+			dst=_small_buf,
+			interpolation=cv2.INTER_AREA,
+		)
+	else:
+		small = frame
+	# Reversed-channel view is a free BGR->RGB "conversion" (no copy).
+	rgb = small[:, :, ::-1]
 	result = _face_mesh.process(rgb)
 
 	# Fallback if no face is detected.
 	if not result.multi_face_landmarks:
-		now_ts = time.time()
-		window_start = now_ts - BLINK_WINDOW_SECONDS
-		_state["blink_timestamps"] = [
-			ts for ts in _state["blink_timestamps"] if ts >= window_start
-		]
-		blink_rate = float(len(_state["blink_timestamps"]))
-
 		return {
-			"blink_rate": blink_rate,
+			"blink_rate": _current_blink_rate(time.monotonic()),
 			"head_forward": False,
 		}
 
 	landmarks = result.multi_face_landmarks[0].landmark
 
-	left_eye = [_landmark_xy(landmarks[i], width, height) for i in LEFT_EYE_IDX]
-	right_eye = [_landmark_xy(landmarks[i], width, height) for i in RIGHT_EYE_IDX]
+	lm_xy = _landmarks_xy(landmarks, width, height)
 
-	left_ear = _eye_aspect_ratio(left_eye)
-	right_ear = _eye_aspect_ratio(right_eye)
-	avg_ear = (left_ear + right_ear) / 2.0
+	now_ts = time.monotonic()
 
-	now_ts = time.time()
+	eye_pts = np.ascontiguousarray(lm_xy[EYE_IDX])
+	avg_ear, new_closed, new_last_ts, blink_triggered = _ear_and_blink(
+		eye_pts,
+		_state["eyes_closed"],
+		_state["last_blink_ts"],
+		now_ts,
+		EAR_CLOSED_THRESHOLD,
+		EAR_OPEN_THRESHOLD,
+		BLINK_DEBOUNCE_SECONDS,
+	)
+	_state["eyes_closed"] = bool(new_closed)
+	_state["last_blink_ts"] = float(new_last_ts)
+	if blink_triggered:
+		_state["blink_count"] += 1
+		_state["blink_timestamps"].append(now_ts)
 
-	# Hysteresis avoids jitter around a single threshold.
-	if _state["eyes_closed"]:
-		if avg_ear > EAR_OPEN_THRESHOLD:
-			if (now_ts - _state["last_blink_ts"]) >= BLINK_DEBOUNCE_SECONDS:
-				_state["blink_count"] += 1
-				_state["last_blink_ts"] = now_ts
-				_state["blink_timestamps"].append(now_ts)
-			_state["eyes_closed"] = False
-	else:
-		if avg_ear < EAR_CLOSED_THRESHOLD:
-			_state["eyes_closed"] = True
-
-	window_start = now_ts - BLINK_WINDOW_SECONDS
-	_state["blink_timestamps"] = [
-		ts for ts in _state["blink_timestamps"] if ts >= window_start
-	]
-	blink_rate = float(len(_state["blink_timestamps"]))
+	blink_rate = _current_blink_rate(now_ts)
 
 	nose_z = landmarks[NOSE_TIP_IDX].z
 	head_forward = bool(nose_z < NOSE_FORWARD_Z_THRESHOLD)
@@ -145,3 +219,72 @@ def extract_face_metrics(frame) -> Dict[str, float | bool]:
 		"blink_rate": float(blink_rate),
 		"head_forward": head_forward,
 	}
+
+
+# Double-buffered asynchronous inference: callers submit the newest frame and
+# immediately get the most recently completed metrics, so FaceMesh latency
+# overlaps with capture of the next frame instead of serializing with it.
+_infer_queue: queue.Queue = queue.Queue(maxsize=1)
+_infer_lock = threading.Lock()
+_infer_thread: threading.Thread | None = None
+_latest_metrics: Dict[str, float | bool] = {"blink_rate": 0.0, "head_forward": False}
+_infer_error_logged = False
+
+
+def _inference_loop() -> None:
+	global _latest_metrics, _infer_error_logged
+	while True:
+		frame = _infer_queue.get()
+		try:
+			metrics = _infer(frame)
+		except Exception:
+			# A persistent failure would otherwise freeze the metrics at
+			# their last value with no trace. Log the first failure of a
+			# streak and flag the stale metrics so consumers can tell.
+			if not _infer_error_logged:
+				_logger.exception("FaceMesh inference failed; metrics are stale")
+				_infer_error_logged = True
+			with _infer_lock:
+				_latest_metrics = {**_latest_metrics, "error": True}
+			continue
+		_infer_error_logged = False
+		with _infer_lock:
+			_latest_metrics = metrics
+
+
+def _ensure_infer_thread() -> None:
+	global _infer_thread
+	if _infer_thread is None or not _infer_thread.is_alive():
+		_infer_thread = threading.Thread(
+			target=_inference_loop, daemon=True, name="facemesh-infer"
+		)
+		_infer_thread.start()
+
+
+def extract_face_metrics(frame) -> Dict[str, float | bool]:
+	"""Extract minimal face metrics from a frame.
+
+	Submits the frame to a background FaceMesh worker (dropping any older
+	pending frame) and returns the latest completed metrics without
+	blocking on inference.
+
+	Args:
+		frame: OpenCV BGR frame.
+
+	Returns:
+		{
+		  "blink_rate": float,   # blinks per minute
+		  "head_forward": bool   # True when nose is sufficiently forward
+		}
+	"""
+	if frame is None:
+		return {"blink_rate": 0.0, "head_forward": False}
+
+	_ensure_infer_thread()
+	try:
+		_infer_queue.put_nowait(frame)
+	except queue.Full:
+		pass
+
+	with _infer_lock:
+		return dict(_latest_metrics)
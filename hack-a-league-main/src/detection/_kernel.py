@@ -0,0 +1,41 @@
+"""Fused per-frame scoring kernel for the load detector.
+
+The blink, posture and breathing components are inlined into one scalar
+function so the per-frame path is a single call instead of four. When Numba
+is available the kernel is JIT-compiled; the pure-Python version is a
+drop-in fallback with identical semantics.
+"""
+
+from __future__ import annotations
+
+try:
+	from numba import njit
+except ImportError:
+	njit = None
+
+
+def _load_score_kernel(blink_rate, head_forward, breathing_rate):
+	"""Compute the rule-based load score, clamped to [0, 100].
+
+	Mirrors the documented heuristics in ``load_detector``:
+	- blink: 0 at <= 10/min, 50 at >= 40/min, linear between
+	- posture: flat 20 when leaning forward
+	- breathing: 0 inside 12-20 BPM, 30 at >= 8 BPM past a boundary
+	"""
+	blink_score = min(max(blink_rate - 10.0, 0.0) * (50.0 / 30.0), 50.0)
+	head_score = 20.0 if head_forward else 0.0
+	deviation = max(0.0, 12.0 - breathing_rate) + max(0.0, breathing_rate - 20.0)
+	breathing_score = min(deviation * (30.0 / 8.0), 30.0)
+	total = blink_score + head_score + breathing_score
+	return min(100.0, max(0.0, total))
+
+
+# Preference order: compiled C extension (see setup.py) > Numba JIT >
+# pure Python. All three implement identical semantics.
+try:
+	from src.detection._load_detector import compute_load_score as load_score_kernel
+except ImportError:
+	if njit is not None:
+		load_score_kernel = njit(cache=True, fastmath=True)(_load_score_kernel)
+	else:
+		load_score_kernel = _load_score_kernel
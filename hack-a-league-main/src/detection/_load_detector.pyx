@@ -0,0 +1,23 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Cython build of the per-frame load-score kernel.
+
+Compile with ``python setup.py build_ext --inplace``. The app runs without
+it: ``src.detection._kernel`` falls back to the Numba or pure-Python kernel
+when this extension is absent. Semantics are identical across all three.
+"""
+
+from libc.math cimport fmax, fmin
+
+
+cpdef double compute_load_score(double blink_rate, bint head_forward,
+		double breathing_rate) nogil:
+	"""Rule-based load score clamped to [0, 100], as straight-line C.
+
+	The ``nogil`` signature lets future batch scorers call this from a
+	C-level loop across threads.
+	"""
+	cdef double blink_score = fmin(fmax(blink_rate - 10.0, 0.0) * (50.0 / 30.0), 50.0)
+	cdef double head_score = 20.0 if head_forward else 0.0
+	cdef double deviation = fmax(0.0, 12.0 - breathing_rate) + fmax(0.0, breathing_rate - 20.0)
+	cdef double breathing_score = fmin(deviation * (30.0 / 8.0), 30.0)
+	return fmin(100.0, fmax(0.0, blink_score + head_score + breathing_score))
@@ -6,51 +6,24 @@ heuristics and normalized to a 0-100 range.
 
 from __future__ import annotations
 
+import numpy as np
 
-def _clamp(value: float, low: float, high: float) -> float:
-	"""Clamp a numeric value into [low, high]."""
-	return max(low, min(high, value))
+from src.detection._kernel import load_score_kernel
 
 
-def _blink_component(blink_rate: float) -> float:
-	"""Map blink rate to a 0-50 load component.
-
-	Heuristic:
-	- <= 10 blinks/min contributes 0
-	- >= 40 blinks/min contributes max (50)
-	- linear interpolation in between
-	"""
-	normalized = (blink_rate - 10.0) / (40.0 - 10.0)
-	normalized = _clamp(normalized, 0.0, 1.0)
-	return normalized * 50.0
-
-
-def _head_forward_component(head_forward: bool) -> float:
-	"""Add posture penalty when user leans forward."""
-	return 20.0 if head_forward else 0.0
-
-
-def _breathing_component(breathing_rate: float) -> float:
-	"""Map breathing deviation from normal (12-20 BPM) to a 0-30 component.
-
-	- Inside normal range: 0 penalty
-	- Outside range: penalty grows with distance from nearest boundary
-	- Maxes out at 30 for large deviations (>= 8 BPM from boundary)
-	"""
-	if 12.0 <= breathing_rate <= 20.0:
-		deviation = 0.0
-	elif breathing_rate < 12.0:
-		deviation = 12.0 - breathing_rate
-	else:
-		deviation = breathing_rate - 20.0
-
-	normalized = _clamp(deviation / 8.0, 0.0, 1.0)
-	return normalized * 30.0
+# Precomputed slopes keep the per-frame components free of divisions.
+_BLINK_SCALE = 50.0 / 30.0   # load points per blink/min above 10
+_BREATH_SCALE = 30.0 / 8.0   # load points per BPM outside the 12-20 band
 
 
 def compute_load_score(blink_rate: float, head_forward: bool, breathing_rate: float) -> float:
 	"""Compute a rule-based cognitive load score in the range [0, 100].
 
+	Heuristics (fused into a single kernel in ``_kernel``):
+	- blink: 0 at <= 10 blinks/min, 50 at >= 40, linear in between
+	- posture: flat 20 penalty when leaning forward
+	- breathing: 0 inside 12-20 BPM, up to 30 past a boundary
+
 	Inputs:
 	- blink_rate: blinks per minute
 	- head_forward: posture flag from face landmarks
@@ -59,9 +32,32 @@ def compute_load_score(blink_rate: float, head_forward: bool, breathing_rate: fl
 	Output:
 	- load_score: float in [0, 100]
 	"""
-	blink_score = _blink_component(float(blink_rate))
-	head_score = _head_forward_component(bool(head_forward))
-	breathing_score = _breathing_component(float(breathing_rate))
+	return float(
+		load_score_kernel(float(blink_rate), bool(head_forward), float(breathing_rate))
+	)
+
+
+def compute_load_score_batch(
+	blink_rates: np.ndarray,
+	head_forwards: np.ndarray,
+	breathing_rates: np.ndarray,
+) -> np.ndarray:
+	"""Vectorized compute_load_score over a window of frames.
 
-	total = blink_score + head_score + breathing_score
-	return float(_clamp(total, 0.0, 100.0))
+	Intended for buffered analysis (e.g. a rolling median of recent load
+	scores): one SIMD pass through NumPy instead of N Python-level calls.
+	Inputs are equal-length 1-D arrays; head_forwards may be bool.
+
+	Output:
+	- float32 array of load scores in [0, 100]
+	"""
+	blink = np.asarray(blink_rates, dtype=np.float32)
+	head = np.asarray(head_forwards, dtype=np.float32)
+	breath = np.asarray(breathing_rates, dtype=np.float32)
+
+	total = np.clip((blink - 10.0) * _BLINK_SCALE, 0.0, 50.0)
+	total += head * 20.0
+	deviation = np.maximum(12.0 - breath, 0.0) + np.maximum(breath - 20.0, 0.0)
+	total += np.clip(deviation * _BREATH_SCALE, 0.0, 30.0)
+	np.minimum(total, 100.0, out=total)
+	return total
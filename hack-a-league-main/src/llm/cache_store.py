@@ -0,0 +1,71 @@
+"""SQLite persistence for the semantic cache.
+
+A monitor session can run for hours and restart often; persisting
+(embedding, response) pairs means a fresh process warm-starts with every
+previously-seen screen context instead of re-paying LLM round-trips.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+
+# Default on-disk location, overridable for tests or multi-profile setups.
+DEFAULT_DB_PATH = os.getenv(
+	"AURA_CACHE_DB",
+	os.path.join(os.path.expanduser("~"), ".aura_semantic_cache.db"),
+)
+
+# Entries older than this are purged on startup; screen contexts from more
+# than a week ago are unlikely to recur verbatim.
+MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+
+
+class CacheStore:
+	"""Append-mostly store of (hash, embedding, response) rows.
+
+	Embeddings are stored as raw float32 bytes and rehydrated with
+	``np.frombuffer``, so a full load is one SELECT plus N buffer views.
+	"""
+
+	def __init__(self, path: str = DEFAULT_DB_PATH):
+		# The background rescue thread writes while import-time code reads,
+		# so share one connection behind a lock.
+		self._conn = sqlite3.connect(path, check_same_thread=False)
+		self._lock = threading.Lock()
+		with self._lock:
+			self._conn.execute(
+				"CREATE TABLE IF NOT EXISTS semantic_cache ("
+				"hash TEXT PRIMARY KEY, embedding BLOB, response TEXT, ts REAL)"
+			)
+			self._conn.execute(
+				"DELETE FROM semantic_cache WHERE ts < ?",
+				(time.time() - MAX_AGE_SECONDS,),
+			)
+			self._conn.commit()
+
+	def load(self) -> list[tuple[np.ndarray, str]]:
+		"""Return all persisted (embedding, response) pairs, oldest first."""
+		with self._lock:
+			rows = self._conn.execute(
+				"SELECT embedding, response FROM semantic_cache ORDER BY ts"
+			).fetchall()
+		return [
+			(np.frombuffer(blob, dtype=np.float32), response)
+			for blob, response in rows
+		]
+
+	def save(self, key: str, embedding: np.ndarray, response: str) -> None:
+		"""Upsert one entry keyed by the caller-supplied content hash."""
+		blob = np.asarray(embedding, dtype=np.float32).tobytes()
+		with self._lock:
+			self._conn.execute(
+				"INSERT OR REPLACE INTO semantic_cache VALUES (?, ?, ?, ?)",
+				(key, blob, response, time.time()),
+			)
+			self._conn.commit()
@@ -5,10 +5,62 @@ This module contains no UI logic. It exposes a single function,
 the model's response as plain text.
 """
 
+from __future__ import annotations
+
+import hashlib
 import os
+import threading
 
 from openai import OpenAI
 
+from src.llm.cache_store import CacheStore
+from src.llm.semantic_cache import SemanticCache, normalize
+
+
+# Embedding model used for semantic cache keys.
+_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# The plan is "summary + 3 bullets" (~80 tokens); cap generation so a
+# runaway response cannot inflate latency or cost.
+_MAX_OUTPUT_TOKENS = 120
+
+# Back the semantic cache with SQLite so restarts warm-start from previous
+# sessions; fall back to memory-only if the database cannot be opened.
+try:
+	_cache_store: CacheStore | None = CacheStore()
+except Exception:
+	_cache_store = None
+
+_semantic_cache = SemanticCache(persistent_store=_cache_store)
+
+
+# Lazily-constructed singleton client: repeated calls reuse the existing HTTP
+# connection pool instead of paying TLS/socket setup on every rescue event.
+_client: OpenAI | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+	"""Return the shared OpenAI client, creating it on first use.
+
+	Raises:
+		ValueError: If `OPENAI_API_KEY` is not configured.
+	"""
+	global _client
+	if _client is None:
+		with _client_lock:
+			if _client is None:
+				api_key = os.getenv("OPENAI_API_KEY")
+				if not api_key:
+					raise ValueError("OPENAI_API_KEY is not set in the environment.")
+				_client = OpenAI(api_key=api_key)
+	return _client
+
+
+def _count_bullets(text: str) -> int:
+	"""Count bullet markers the model uses for the action plan."""
+	return text.count("\n- ") + text.count("•")
+
 
 def summarize_text(text: str) -> str:
 	"""Summarize user work context and return a 3-bullet action plan.
@@ -27,13 +79,22 @@ def summarize_text(text: str) -> str:
 	Raises:
 		ValueError: If `OPENAI_API_KEY` is not configured.
 	"""
-	# Read API key from environment, as required.
-	api_key = os.getenv("OPENAI_API_KEY")
-	if not api_key:
-		raise ValueError("OPENAI_API_KEY is not set in the environment.")
+	# Reuse the shared client so the HTTP connection stays warm.
+	client = _get_client()
 
-	# Initialize the OpenAI client with the environment-provided key.
-	client = OpenAI(api_key=api_key)
+	# Near-duplicate inputs (screen text rarely changes between rescue
+	# events) are answered from the semantic cache: an embedding call plus
+	# one dot product instead of a full generation round-trip.
+	embedding = normalize(
+		client.embeddings.create(model=_EMBEDDING_MODEL, input=text).data[0].embedding
+	)
+	cached = _semantic_cache.lookup(embedding)
+	if cached is not None:
+		return cached
+
+	# One content hash serves both the prompt-cache header and the
+	# persistent cache key.
+	text_hash = hashlib.sha1(text.encode()).hexdigest()
 
 	# Fixed instruction prompt from requirements.
 	instruction = (
@@ -41,14 +102,37 @@ def summarize_text(text: str) -> str:
 		"action plan."
 	)
 
-	# Use the Responses API to generate the summary.
-	response = client.responses.create(
+	# Use the Responses API to generate the summary. The prompt-cache-key
+	# header lets OpenAI's server-side prompt caching reuse the shared
+	# instruction prefix across calls. Streaming lets us stop as soon as
+	# the third bullet is complete: output tokens dominate latency, so
+	# aborting there returns the plan without waiting for trailing prose.
+	stream = client.responses.create(
 		model="gpt-4.1-mini",
 		input=[
 			{"role": "system", "content": instruction},
 			{"role": "user", "content": text},
 		],
+		max_output_tokens=_MAX_OUTPUT_TOKENS,
+		stream=True,
+		extra_headers={"prompt-cache-key": text_hash},
 	)
 
-	# Return model response text. `output_text` is the simplest direct accessor.
-	return response.output_text
+	chunks: list[str] = []
+	buffer = ""
+	try:
+		for event in stream:
+			if event.type != "response.output_text.delta":
+				continue
+			chunks.append(event.delta)
+			buffer += event.delta
+			# A bullet counts once its line is terminated, i.e. the third
+			# marker is followed by a newline somewhere in the buffer.
+			if _count_bullets(buffer) >= 3 and buffer.rstrip(" ").endswith("\n"):
+				break
+	finally:
+		stream.close()
+
+	result = "".join(chunks).rstrip()
+	_semantic_cache.store(embedding, result, key=text_hash)
+	return result
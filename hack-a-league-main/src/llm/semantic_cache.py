@@ -0,0 +1,85 @@
+"""In-process semantic cache for LLM responses.
+
+Stores (embedding, response) pairs so near-duplicate inputs — e.g. OCR text
+from a screen that barely changed between rescue events — are answered from
+cache instead of paying a full API round-trip.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+# Cosine-similarity threshold above which a cached response is reused.
+SIMILARITY_THRESHOLD = 0.92
+
+# Maximum number of cached entries; the least-recently-used one is evicted.
+MAX_ENTRIES = 128
+
+
+def normalize(vector) -> np.ndarray:
+	"""Return the vector as a unit-norm float32 array."""
+	vec = np.asarray(vector, dtype=np.float32)
+	norm = float(np.linalg.norm(vec))
+	return vec / norm if norm else vec
+
+
+class SemanticCache:
+	"""LRU-bounded response cache keyed by normalized embeddings.
+
+	Lookup is a single matrix-vector product over all cached embeddings, so
+	it runs at BLAS speed even at the maximum cache size.
+	"""
+
+	def __init__(
+		self,
+		threshold: float = SIMILARITY_THRESHOLD,
+		max_entries: int = MAX_ENTRIES,
+		persistent_store=None,
+	):
+		self._threshold = threshold
+		self._max_entries = max_entries
+		self._store = persistent_store
+		self._vectors: list[np.ndarray] = []
+		self._responses: list[str] = []
+		if persistent_store is not None:
+			# Warm-start from disk; keep only the newest rows if the
+			# persisted set outgrew the in-memory bound.
+			for vector, response in persistent_store.load()[-max_entries:]:
+				self._vectors.append(vector)
+				self._responses.append(response)
+
+	def __len__(self) -> int:
+		return len(self._responses)
+
+	def lookup(self, embedding: np.ndarray) -> str | None:
+		"""Return the cached response most similar to `embedding`, if any.
+
+		A hit counts as a use: the entry moves to the most-recently-used
+		position. Returns None when no entry clears the threshold.
+		"""
+		if not self._vectors:
+			return None
+
+		similarities = np.vstack(self._vectors) @ embedding
+		best = int(np.argmax(similarities))
+		if float(similarities[best]) < self._threshold:
+			return None
+
+		self._vectors.append(self._vectors.pop(best))
+		self._responses.append(self._responses.pop(best))
+		return self._responses[-1]
+
+	def store(self, embedding: np.ndarray, response: str, key: str | None = None) -> None:
+		"""Add an entry, evicting the least-recently-used one when full.
+
+		When a persistent store is attached and `key` (a stable content
+		hash) is given, the entry is also written through to disk.
+		"""
+		if len(self._vectors) >= self._max_entries:
+			self._vectors.pop(0)
+			self._responses.pop(0)
+		self._vectors.append(embedding)
+		self._responses.append(response)
+		if self._store is not None and key is not None:
+			self._store.save(key, embedding, response)
